@@ -10,16 +10,21 @@ Version: 1.0.0
 Developer: sashathemiot
 Website: https://edspecbot.com
 """
+import functools
 import logging
 import os
+import re
 import threading
-import queue
 import time
+from collections import deque
 import webbrowser
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from config import appname, config
 import timeout_session
+import requests
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+from urllib3.util.retry import Retry
 import tkinter as tk
 import tkinter.messagebox as messagebox
 import myNotebook as nb
@@ -40,21 +45,224 @@ CHECK_UPDATES_SETTING = f'{plugin_name}.check_updates'
 # Default values
 DEFAULT_API_URL = 'https://edspecbot.com/api/edmcConnector'
 
+# Scheduler timings (seconds)
+STARTUP_COUNTDOWN = 10
+PING_INTERVAL = 30
+UPDATE_CHECK_DELAY = 5
+
+# Status label (text, colour) for each connection status except 'disconnected'
+_STATUS_TABLE = {
+    'success': ('In Sync', 'green'),
+    'connecting': ('Connecting...', 'orange'),
+    'auth_failed': ('API Key invalid', 'red'),
+    'failed': ('Connection failed', 'red'),
+}
+
+# Journal events that trigger a send
+_SEND_EVENTS = frozenset({'FSDJump', 'Location', 'Docked', 'Undocked', 'Loadout', 'Embark', 'Disembark'})
+
+# Version number in a GitHub release name, e.g. 'v1.2.0' or 'Release 1.2'
+_VERSION_RE = re.compile(r'(?:v)?(\d+\.\d+(?:\.\d+)?)', re.IGNORECASE)
+_DIGITS = frozenset('0123456789')
+
+# Preferences panel description text
+_PREFS_DESCRIPTION = (
+    'Connect your Elite Dangerous game data to the EDSpec Discord bot.\n\n'
+    'This integration automatically shares your commander data including:\n'
+    '• Your current location and system\n'
+    '• Station information when docked\n'
+    '• Active ship details\n'
+    '• Credit balance\n'
+    '• On-foot, docked, or undocked status\n\n'
+    'Your data is sent in real-time when game events occur like FSD jumps,\n'
+    'docking, or loadout changes.'
+)
+
+# Static preferences panel widgets as (widget class, options, grid options).
+# Widgets that are read or bound later are created explicitly in plugin_prefs.
+_PREFS_ROWS = (
+    # Title - EDSpec styled
+    (nb.Label, {'text': 'EDSpec', 'font': ('Helvetica', 18, 'bold')},
+     {'row': 0, 'column': 0, 'columnspan': 2, 'sticky': tk.W, 'pady': (15, 8), 'padx': (20, 5)}),
+    # Subtitle
+    (nb.Label, {'text': 'A Discord bot for Elite Dangerous!', 'font': ('Helvetica', 10)},
+     {'row': 1, 'column': 0, 'columnspan': 2, 'sticky': tk.W, 'pady': (0, 25), 'padx': (20, 5)}),
+    # Description section
+    (nb.Label, {'text': _PREFS_DESCRIPTION, 'justify': tk.LEFT, 'wraplength': 550, 'font': ('Helvetica', 9)},
+     {'row': 2, 'column': 0, 'columnspan': 2, 'sticky': tk.W, 'pady': (0, 20), 'padx': (20, 5)}),
+    # Privacy options section
+    (nb.Label, {'text': 'Privacy Options:', 'font': ('Helvetica', 10)},
+     {'row': 4, 'column': 0, 'columnspan': 2, 'sticky': tk.W, 'pady': (20, 5), 'padx': (20, 5)}),
+    (nb.Label, {'text': 'Note: System and station information is always shared', 'justify': tk.LEFT,
+                'wraplength': 520, 'font': ('Helvetica', 8), 'foreground': 'gray'},
+     {'row': 6, 'column': 0, 'columnspan': 2, 'sticky': tk.W, 'pady': (0, 15), 'padx': (40, 5)}),
+    # Update check section
+    (nb.Label, {'text': 'Updates:', 'font': ('Helvetica', 10)},
+     {'row': 7, 'column': 0, 'columnspan': 2, 'sticky': tk.W, 'pady': (20, 5), 'padx': (20, 5)}),
+    (nb.Label, {'text': f'Current version: {PLUGIN_VERSION}', 'font': ('Helvetica', 8), 'foreground': 'gray'},
+     {'row': 9, 'column': 0, 'columnspan': 2, 'sticky': tk.W, 'pady': (0, 15), 'padx': (40, 5)}),
+    # API Key section
+    (nb.Label, {'text': 'API Key:'},
+     {'row': 10, 'column': 0, 'sticky': tk.W, 'pady': 8, 'padx': (20, 5)}),
+)
+
 # Global state
 status_label: Optional[tk.Label] = None
-send_queue: Optional[queue.Queue] = None
-worker_thread: Optional[threading.Thread] = None
-ping_thread: Optional[threading.Thread] = None
-update_check_thread: Optional[threading.Thread] = None
+# Payloads waiting for the scheduler thread, which merges them field by field
+# into one POST per wake-up. Unbounded so no payload's fields are dropped.
+send_buffer: Optional[deque] = None
+send_event = threading.Event()
+scheduler_thread: Optional[threading.Thread] = None
 stop_event = threading.Event()
-ping_event = threading.Event()
-update_check_event = threading.Event()
 update_check_performed = False
 prefs_frame: Optional[object] = None
 last_connection_status = 'disconnected'
 last_connection_message = 'Active'
 current_cmdr = ''
-countdown_seconds = 10
+countdown_seconds = STARTUP_COUNTDOWN
+
+# Monotonic time of the last successful data send, used to skip redundant pings
+_last_successful_post = 0.0
+
+# Hash of the last queued journal payload, used to skip duplicate sends
+_last_payload_hash: Optional[int] = None
+
+# Cached config values, cleared whenever preferences are saved. The lock is
+# held while filling the cache and while saving, so a value read before a save
+# can't be stored after the cache has been cleared.
+_cfg_cache: dict = {}
+_cfg_cache_lock = threading.Lock()
+
+# Request headers per API key, cleared whenever preferences are saved
+_headers_cache: dict = {}
+
+# Shared session for all EDSpec API calls
+_api_session: Optional[requests.Session] = None
+_api_session_lock = threading.Lock()
+
+
+class CapiSnapshot:
+    """
+    Commander data taken from a CAPI callback, waiting to be sent.
+    
+    Fields left as None were not available (or not shared) and are left
+    out of the payload sent to the API.
+    """
+    __slots__ = ('cmdr', 'system', 'station', 'credits', 'ship')
+    
+    def __init__(self, cmdr: str) -> None:
+        self.cmdr = cmdr
+        self.system: Optional[str] = None
+        self.station: Optional[str] = None
+        self.credits: Optional[int] = None
+        self.ship: Optional[str] = None
+    
+    def as_payload(self) -> dict:
+        """
+        Build the JSON payload for the EDSpec API.
+        
+        Returns:
+            Dict of the fields that are set
+        """
+        payload = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                payload[name] = value
+        return payload
+
+
+def _cget(key: str, default):
+    """
+    Get a config value, caching it until the next preferences save.
+    
+    Args:
+        key: The config setting name
+        default: Value to use when the setting has never been saved
+        
+    Returns:
+        The cached config value, or default if unset
+    """
+    try:
+        return _cfg_cache[key]
+    except KeyError:
+        pass
+    
+    with _cfg_cache_lock:
+        if key not in _cfg_cache:
+            value = config.get(key)
+            _cfg_cache[key] = default if value is None else value
+        return _cfg_cache[key]
+
+
+def _get_api_session() -> requests.Session:
+    """
+    Get the shared EDSpec API session, creating it on first use.
+    
+    Reusing one session keeps the connection to the API open between
+    sends instead of doing a new TLS handshake each time. Requests that
+    hit a transient gateway error are retried a couple of times before
+    the caller sees the response.
+    
+    Returns:
+        The shared requests session
+    """
+    global _api_session
+    
+    with _api_session_lock:
+        if _api_session is None:
+            # Payloads are state snapshots, so retrying a POST is safe. Only
+            # gateway errors are retried, at most twice with a short backoff;
+            # connect errors and read timeouts fail on the first attempt.
+            # read=False re-raises read timeouts as ReadTimeout, as requests'
+            # own default does, rather than wrapping them in ConnectionError.
+            # Retry-After is ignored: a maintenance 503 can ask for hours, and
+            # plugin_stop sends its disconnect ping on EDMC's main thread.
+            retry = Retry(
+                total=None,
+                connect=0,
+                read=False,
+                other=0,
+                status=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({'POST'}),
+                respect_retry_after_header=False,
+                raise_on_status=False
+            )
+            # One host, with at most the scheduler and Test Connection threads
+            # sending at once. TimeoutAdapter keeps EDMC's default timeout.
+            adapter = timeout_session.TimeoutAdapter(
+                timeout_session.REQUEST_TIMEOUT,
+                pool_connections=1,
+                pool_maxsize=2,
+                max_retries=retry
+            )
+            _api_session = timeout_session.new_session()
+            _api_session.mount('http://', adapter)
+            _api_session.mount('https://', adapter)
+        return _api_session
+
+
+def _get_headers(api_key: str) -> dict:
+    """
+    Get the EDSpec API request headers for an API key.
+    
+    Args:
+        api_key: The EDSpec API key
+        
+    Returns:
+        The cached headers dict; callers must not modify it
+    """
+    headers = _headers_cache.get(api_key)
+    if headers is None:
+        headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json',
+            'User-Agent': f'{appname}/{plugin_name}'
+        }
+        _headers_cache[api_key] = headers
+    return headers
 
 
 def plugin_start3(plugin_dir: str) -> str:
@@ -67,24 +275,19 @@ def plugin_start3(plugin_dir: str) -> str:
     Returns:
         The plugin's internal name
     """
-    global send_queue, worker_thread, ping_thread, stop_event, ping_event, update_check_performed
+    global send_buffer, scheduler_thread, stop_event, update_check_performed
+    global _last_payload_hash
     
     logger.info(f'EDSpec plugin starting from {plugin_dir}')
     
-    send_queue = queue.Queue()
+    send_buffer = deque()
+    send_event.clear()
+    _last_payload_hash = None
     update_check_performed = False
     
     stop_event.clear()
-    ping_event.clear()
-    worker_thread = threading.Thread(target=worker_thread_loop, daemon=True)
-    worker_thread.start()
-    
-    ping_thread = threading.Thread(target=ping_thread_loop, daemon=True)
-    ping_thread.start()
-    
-    update_check_event.clear()
-    update_check_thread = threading.Thread(target=check_for_updates_delayed, daemon=True)
-    update_check_thread.start()
+    scheduler_thread = threading.Thread(target=scheduler_thread_loop, daemon=True)
+    scheduler_thread.start()
     
     logger.info('EDSpec plugin started successfully')
     return 'EDSpec'
@@ -94,36 +297,29 @@ def plugin_stop() -> None:
     """
     Cleanup when EDMarketConnector shuts down.
     """
-    global stop_event, ping_event, worker_thread, ping_thread
+    global stop_event, scheduler_thread, _api_session
     
     logger.info('EDSpec plugin stopping')
     
     # Send disconnect message before shutting down
     send_disconnect_message()
     
-    # Signal threads to stop
+    # Signal the scheduler thread to stop
     if stop_event:
         stop_event.set()
-    if ping_event:
-        ping_event.set()
-    if update_check_event:
-        update_check_event.set()
-    
-    # Wait for threads to finish (max 5 seconds each)
-    if worker_thread:
-        worker_thread.join(timeout=5)
-        if worker_thread.is_alive():
-            logger.warning('Worker thread did not stop within timeout')
-    
-    if ping_thread:
-        ping_thread.join(timeout=5)
-        if ping_thread.is_alive():
-            logger.warning('Ping thread did not stop within timeout')
-    
-    if update_check_thread:
-        update_check_thread.join(timeout=5)
-        if update_check_thread.is_alive():
-            logger.warning('Update check thread did not stop within timeout')
+    # Wake the scheduler thread, which blocks until there is work
+    send_event.set()
+    
+    # Wait for the thread to finish (max 5 seconds)
+    if scheduler_thread:
+        scheduler_thread.join(timeout=5)
+        if scheduler_thread.is_alive():
+            logger.warning('Scheduler thread did not stop within timeout')
+    
+    with _api_session_lock:
+        if _api_session:
+            _api_session.close()
+            _api_session = None
     
     logger.info('EDSpec plugin stopped')
 
@@ -166,70 +362,33 @@ def plugin_prefs(parent: nb.Notebook, cmdr: str, is_beta: bool) -> nb.Frame:
     frame = nb.Frame(parent)
     frame.columnconfigure(1, weight=1)
     
-    # Title - EDSpec styled
-    title_label = nb.Label(frame, text='EDSpec', font=('Helvetica', 18, 'bold'))
-    title_label.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(15, 8), padx=(20, 5))
-    
-    # Subtitle
-    nb.Label(frame, text='A Discord bot for Elite Dangerous!', font=('Helvetica', 10)).grid(
-        row=1, column=0, columnspan=2, sticky=tk.W, pady=(0, 25), padx=(20, 5)
-    )
-    
-    # Description section
-    desc_text = (
-        'Connect your Elite Dangerous game data to the EDSpec Discord bot.\n\n'
-        'This integration automatically shares your commander data including:\n'
-        '• Your current location and system\n'
-        '• Station information when docked\n'
-        '• Active ship details\n'
-        '• Credit balance\n'
-        '• On-foot, docked, or undocked status\n\n'
-        'Your data is sent in real-time when game events occur like FSD jumps,\n'
-        'docking, or loadout changes.'
-    )
-    nb.Label(frame, text=desc_text, justify=tk.LEFT, wraplength=550, font=('Helvetica', 9)).grid(
-        row=2, column=0, columnspan=2, sticky=tk.W, pady=(0, 20), padx=(20, 5)
-    )
+    # Static labels
+    for widget_cls, options, grid_options in _PREFS_ROWS:
+        widget_cls(frame, **options).grid(**grid_options)
     
     # Enable checkbox
-    enabled_var = tk.BooleanVar(value=config.get(ENABLED_SETTING) if config.get(ENABLED_SETTING) is not None else True)
+    enabled = config.get(ENABLED_SETTING)
+    enabled_var = tk.BooleanVar(value=True if enabled is None else enabled)
     nb.Checkbutton(frame, text='Enable EDSpec integration', variable=enabled_var).grid(
         row=3, column=0, columnspan=2, sticky=tk.W, pady=10, padx=(20, 5)
     )
     
-    # Privacy options section
-    nb.Label(frame, text='Privacy Options:', font=('Helvetica', 10)).grid(
-        row=4, column=0, columnspan=2, sticky=tk.W, pady=(20, 5), padx=(20, 5)
-    )
-    
-    send_ship_info_var = tk.BooleanVar(value=config.get(SEND_SHIP_INFO_SETTING) if config.get(SEND_SHIP_INFO_SETTING) is not None else True)
+    # Privacy options
+    send_ship_info = config.get(SEND_SHIP_INFO_SETTING)
+    send_ship_info_var = tk.BooleanVar(value=True if send_ship_info is None else send_ship_info)
     nb.Checkbutton(frame, text='Share additional data (ship, credits, on-foot status)', variable=send_ship_info_var).grid(
         row=5, column=0, columnspan=2, sticky=tk.W, pady=5, padx=(40, 5)
     )
     
-    nb.Label(frame, text='Note: System and station information is always shared', 
-             justify=tk.LEFT, wraplength=520, font=('Helvetica', 8), foreground='gray').grid(
-        row=6, column=0, columnspan=2, sticky=tk.W, pady=(0, 15), padx=(40, 5)
-    )
-    
-    # Update check section
-    nb.Label(frame, text='Updates:', font=('Helvetica', 10)).grid(
-        row=7, column=0, columnspan=2, sticky=tk.W, pady=(20, 5), padx=(20, 5)
-    )
-    
-    check_updates_var = tk.BooleanVar(value=config.get(CHECK_UPDATES_SETTING) if config.get(CHECK_UPDATES_SETTING) is not None else True)
+    # Update check option
+    check_updates = config.get(CHECK_UPDATES_SETTING)
+    check_updates_var = tk.BooleanVar(value=True if check_updates is None else check_updates)
     nb.Checkbutton(frame, text='Check for updates on startup', variable=check_updates_var).grid(
         row=8, column=0, columnspan=2, sticky=tk.W, pady=5, padx=(40, 5)
     )
     
-    current_version_label = nb.Label(frame, text=f'Current version: {PLUGIN_VERSION}', 
-                                     font=('Helvetica', 8), foreground='gray')
-    current_version_label.grid(row=9, column=0, columnspan=2, sticky=tk.W, pady=(0, 15), padx=(40, 5))
-    
     # API Key section
-    api_key_label = nb.Label(frame, text='API Key:')
-    api_key_label.grid(row=10, column=0, sticky=tk.W, pady=8, padx=(20, 5))
-    api_key_var = tk.StringVar(value=config.get(API_KEY_SETTING) if config.get(API_KEY_SETTING) else '')
+    api_key_var = tk.StringVar(value=config.get(API_KEY_SETTING) or '')
     api_key_entry = nb.Entry(frame, textvariable=api_key_var, width=50, show='*', font=('Helvetica', 9))
     api_key_entry.grid(row=10, column=1, sticky=tk.W+tk.E, pady=8, padx=5)
     
@@ -264,27 +423,29 @@ def plugin_prefs(parent: nb.Notebook, cmdr: str, is_beta: bool) -> nb.Frame:
         test_button_cooldown_active['value'] = True
         test_button.config(state='disabled')
         original_text = test_button['text']
+        cooldown_deadline = time.monotonic() + 10
         
         def reenable_button():
             test_button_cooldown_active['value'] = False
             test_button.config(state='normal', text=original_text)
         
-        def update_cooldown_text(seconds_left):
-            if seconds_left > 0:
+        def update_cooldown_text():
+            seconds_left = round(cooldown_deadline - time.monotonic())
+            if test_button_cooldown_active['value'] and seconds_left > 0:
                 test_button.config(text=f'Test Connection (cooldown: {seconds_left}s)')
-                frame.after(1000, lambda: update_cooldown_text(seconds_left - 1))
-            else:
-                reenable_button()
+                frame.after(1000, update_cooldown_text)
         
-        # Start cooldown countdown
-        update_cooldown_text(10)
+        # Start cooldown countdown; the button is re-enabled by a single timer
+        frame.after(10000, reenable_button)
+        update_cooldown_text()
         
         test_result_var.set('Testing connection...')
-        frame.update_idletasks()
         
         # Save the current API key to config before testing
         if prefs_frame and hasattr(prefs_frame, 'api_key_var'):
-            config.set(API_KEY_SETTING, prefs_frame.api_key_var.get())
+            with _cfg_cache_lock:
+                config.set(API_KEY_SETTING, prefs_frame.api_key_var.get())
+                _cfg_cache.clear()
         
         # Get the current value from the UI
         current_api_key = api_key_var.get()
@@ -298,12 +459,8 @@ def plugin_prefs(parent: nb.Notebook, cmdr: str, is_beta: bool) -> nb.Frame:
                     test_result_var.set('❌ No API key configured')
                     return
                 
-                session = timeout_session.new_session()
-                headers = {
-                    'Authorization': f'Bearer {api_key}',
-                    'Content-Type': 'application/json',
-                    'User-Agent': f'{appname}/{plugin_name}'
-                }
+                session = _get_api_session()
+                headers = _get_headers(api_key)
                 
                 data = {'connected': True, 'test': True}
                 response = session.post(api_url, json=data, headers=headers, timeout=10)
@@ -315,14 +472,12 @@ def plugin_prefs(parent: nb.Notebook, cmdr: str, is_beta: bool) -> nb.Frame:
                 else:
                     test_result_var.set(f'❌ Unexpected response: {response.status_code}')
                     
+            except Timeout:
+                test_result_var.set('❌ Connection timed out - server may be down')
+            except RequestsConnectionError:
+                test_result_var.set('❌ Failed to connect - check if the server is running')
             except Exception as e:
-                error_msg = str(e)
-                if 'getaddrinfo failed' in error_msg or 'NameResolutionError' in error_msg:
-                    test_result_var.set('❌ Failed to connect - check if the server is running')
-                elif 'Connection refused' in error_msg:
-                    test_result_var.set('❌ Connection refused - server may be down')
-                else:
-                    test_result_var.set(f'❌ Error: {error_msg[:60]}')
+                test_result_var.set(f'❌ Error: {str(e)[:60]}')
         
         # Run test in a thread to avoid blocking UI
         threading.Thread(target=do_test, daemon=True).start()
@@ -351,23 +506,31 @@ def prefs_changed(cmdr: str, is_beta: bool) -> None:
         cmdr: Current commander name
         is_beta: Whether this is a beta game
     """
-    global prefs_frame
+    global prefs_frame, _last_payload_hash
     
     logger.info('Saving EDSpec preferences')
     
     # Access the stored frame and its variables
     if prefs_frame and hasattr(prefs_frame, 'enabled_var'):
-        # Save enabled state
-        config.set(ENABLED_SETTING, int(prefs_frame.enabled_var.get()))
-        
-        # Save API Key
-        config.set(API_KEY_SETTING, prefs_frame.api_key_var.get())
-        
-        # Save privacy preferences
-        config.set(SEND_SHIP_INFO_SETTING, int(prefs_frame.send_ship_info_var.get()))
+        with _cfg_cache_lock:
+            # Save enabled state
+            config.set(ENABLED_SETTING, int(prefs_frame.enabled_var.get()))
+            
+            # Save API Key
+            config.set(API_KEY_SETTING, prefs_frame.api_key_var.get())
+            
+            # Save privacy preferences
+            config.set(SEND_SHIP_INFO_SETTING, int(prefs_frame.send_ship_info_var.get()))
+            
+            # Save update check preference
+            config.set(CHECK_UPDATES_SETTING, int(prefs_frame.check_updates_var.get()))
+            
+            # Drop cached values so the new settings take effect
+            _cfg_cache.clear()
+        _headers_cache.clear()
         
-        # Save update check preference
-        config.set(CHECK_UPDATES_SETTING, int(prefs_frame.check_updates_var.get()))
+        # Resend the current state even if it matches the last event
+        _last_payload_hash = None
         
         logger.info('EDSpec preferences saved successfully')
     else:
@@ -386,8 +549,8 @@ def update_status() -> None:
         return
     
     try:
-        api_key = config.get(API_KEY_SETTING) if config.get(API_KEY_SETTING) else ''
-        enabled = config.get(ENABLED_SETTING) if config.get(ENABLED_SETTING) is not None else True
+        api_key = _cget(API_KEY_SETTING, '')
+        enabled = _cget(ENABLED_SETTING, True)
         
         if not api_key:
             status_label['text'] = 'Not configured'
@@ -397,18 +560,9 @@ def update_status() -> None:
             status_label['foreground'] = 'orange'
         else:
             # Use last known connection status
-            if last_connection_status == 'success':
-                status_label['text'] = 'In Sync'
-                status_label['foreground'] = 'green'
-            elif last_connection_status == 'connecting':
-                status_label['text'] = 'Connecting...'
-                status_label['foreground'] = 'orange'
-            elif last_connection_status == 'auth_failed':
-                status_label['text'] = 'API Key invalid'
-                status_label['foreground'] = 'red'
-            elif last_connection_status == 'failed':
-                status_label['text'] = 'Connection failed'
-                status_label['foreground'] = 'red'
+            status_entry = _STATUS_TABLE.get(last_connection_status)
+            if status_entry:
+                status_label['text'], status_label['foreground'] = status_entry
             else:  # disconnected or unknown
                 global countdown_seconds
                 if countdown_seconds > 0:
@@ -423,71 +577,149 @@ def update_status() -> None:
         status_label['foreground'] = 'red'
 
 
-def worker_thread_loop() -> None:
+def scheduler_thread_loop() -> None:
     """
-    Worker thread that sends data to the EDSpec API.
-    This thread runs in the background and processes items from the queue.
+    Background thread that does all of the plugin's network work.
+    
+    Sends queued data to the EDSpec API as it arrives, merging payloads that
+    queued up during the previous send into one request, shows the startup
+    countdown before connecting, pings every PING_INTERVAL seconds to keep
+    the connection alive and starts the one-off update check. Waiting on
+    send_event with a timeout up to the next deadline lets one thread do this.
     """
-    session = timeout_session.new_session()
+    started_at = time.monotonic()
+    countdown_remaining = STARTUP_COUNTDOWN
+    next_countdown_at: Optional[float] = started_at
+    next_ping_at: Optional[float] = None
+    next_update_check_at: Optional[float] = started_at + UPDATE_CHECK_DELAY
     
     while not stop_event.is_set():
         try:
-            # Try to get data from queue (with timeout)
-            try:
-                data = send_queue.get(timeout=1)
-            except queue.Empty:
-                continue
-            
-            # Check if we're enabled
-            enabled = config.get(ENABLED_SETTING) if config.get(ENABLED_SETTING) is not None else True
-            if not enabled:
-                logger.debug('Plugin disabled, skipping send')
-                continue
+            deadlines = [d for d in (next_countdown_at, next_ping_at, next_update_check_at) if d is not None]
+            timeout = max(0.0, min(deadlines) - time.monotonic())
             
-            # Get configuration
-            api_url = DEFAULT_API_URL
-            api_key = config.get(API_KEY_SETTING) if config.get(API_KEY_SETTING) else ''
+            # Wait for data or the next deadline; plugin_stop also sets send_event to wake us
+            if send_event.wait(timeout):
+                if stop_event.is_set():
+                    break
+                
+                # Clear before draining so data queued meanwhile sets it again
+                send_event.clear()
+                
+                # Events often arrive in bursts (e.g. Location, Docked, Loadout),
+                # so drain the buffer and send one merged payload. Journal and
+                # CAPI payloads carry different fields, so newer values only
+                # replace the fields they actually contain.
+                data = {}
+                while send_buffer:
+                    item = send_buffer.popleft()
+                    if isinstance(item, CapiSnapshot):
+                        item = item.as_payload()
+                    data.update(item)
+                
+                if data:
+                    send_data(data)
             
-            if not api_key:
-                logger.warning('No API key configured')
-                continue
+            now = time.monotonic()
             
-            # Prepare headers
-            headers = {
-                'Authorization': f'Bearer {api_key}',
-                'Content-Type': 'application/json',
-                'User-Agent': f'{appname}/{plugin_name}'
-            }
+            if next_countdown_at is not None and now >= next_countdown_at:
+                if countdown_remaining > 0:
+                    show_countdown(countdown_remaining)
+                    countdown_remaining -= 1
+                    next_countdown_at += 1
+                else:
+                    next_countdown_at = None
+                    start_connection()
+                    next_ping_at = time.monotonic() + PING_INTERVAL
             
-            # Send data to API
-            try:
-                response = session.post(api_url, json=data, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    logger.debug('Successfully sent data to EDSpec')
-                    update_status_with_color('green')
-                elif response.status_code == 401:
-                    logger.warning('Authentication failed - check your API key')
-                    update_status_with_color('red', auth_failed=True)
+            if next_ping_at is not None and now >= next_ping_at:
+                if now - _last_successful_post < PING_INTERVAL:
+                    # A recent send already told the server we're connected
+                    next_ping_at = _last_successful_post + PING_INTERVAL
                 else:
-                    logger.warning(f'Unexpected response from EDSpec: {response.status_code}')
-                    update_status_with_color('orange')
-                    
-            except Exception as e:
-                logger.error(f'Failed to send data to EDSpec: {e}')
-                update_status_with_color('red')
+                    send_connection_ping(connected=True)
+                    next_ping_at = time.monotonic() + PING_INTERVAL
             
-            # Mark task as done
-            send_queue.task_done()
+            if next_update_check_at is not None and now >= next_update_check_at:
+                next_update_check_at = None
+                # The GitHub request can take up to 10s, so keep it off this thread
+                threading.Thread(target=check_for_updates, daemon=True).start()
             
         except Exception as e:
-            logger.exception('Error in worker thread loop')
-            time.sleep(1)
+            logger.exception('Error in scheduler thread loop')
+            if stop_event.wait(1):
+                break
+
+
+def queue_send(data: Union[dict, CapiSnapshot]) -> None:
+    """
+    Queue a data payload for the scheduler thread to send.
+    
+    Payloads still queued when the scheduler wakes are merged, with newer
+    values overwriting older ones field by field.
+    
+    Args:
+        data: The payload to send
+    """
+    send_buffer.append(data)
+    # Only wake the scheduler if it isn't already due to drain the buffer
+    if not send_event.is_set():
+        send_event.set()
+
+
+def send_data(data: dict) -> None:
+    """
+    Send a data payload to the EDSpec API.
+    
+    Args:
+        data: The payload to send
+    """
+    global _last_successful_post, _last_payload_hash
+    
+    # Check if we're enabled
+    enabled = _cget(ENABLED_SETTING, True)
+    if not enabled:
+        logger.debug('Plugin disabled, skipping send')
+        return
+    
+    # Get configuration
+    api_url = DEFAULT_API_URL
+    api_key = _cget(API_KEY_SETTING, '')
+    
+    if not api_key:
+        logger.warning('No API key configured')
+        return
+    
+    # Prepare headers
+    headers = _get_headers(api_key)
+    
+    # Send data to API
+    try:
+        response = _get_api_session().post(api_url, json=data, headers=headers, timeout=10)
+        
+        if response.status_code == 200:
+            logger.debug('Successfully sent data to EDSpec')
+            _last_successful_post = time.monotonic()
+            update_status_with_color('green')
+            return
+        elif response.status_code == 401:
+            logger.warning('Authentication failed - check your API key')
+            update_status_with_color('red', auth_failed=True)
+        else:
+            logger.warning(f'Unexpected response from EDSpec: {response.status_code}')
+            update_status_with_color('orange')
+            
+    except Exception as e:
+        logger.error(f'Failed to send data to EDSpec: {e}')
+        update_status_with_color('red')
+    
+    # Not delivered, so the next journal event must not be skipped as a duplicate
+    _last_payload_hash = None
 
 
 def update_status_with_color(color: str, auth_failed: bool = False) -> None:
     """
-    Update status based on connection result from worker thread.
+    Update status based on connection result from the scheduler thread.
     
     Args:
         color: Color result ('green', 'red', 'orange', etc.)
@@ -514,22 +746,18 @@ def send_connection_ping(connected: bool = True) -> None:
         connected: True for connected, False for disconnected
     """
     try:
-        enabled = config.get(ENABLED_SETTING) if config.get(ENABLED_SETTING) is not None else True
+        enabled = _cget(ENABLED_SETTING, True)
         if not enabled:
             return
         
         api_url = DEFAULT_API_URL
-        api_key = config.get(API_KEY_SETTING) if config.get(API_KEY_SETTING) else ''
+        api_key = _cget(API_KEY_SETTING, '')
         
         if not api_key:
             return
         
-        session = timeout_session.new_session()
-        headers = {
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json',
-            'User-Agent': f'{appname}/{plugin_name}'
-        }
+        session = _get_api_session()
+        headers = _get_headers(api_key)
         
         data = {'connected': connected}
         
@@ -558,27 +786,33 @@ def send_disconnect_message() -> None:
     logger.info('Sent disconnect message to EDSpec')
 
 
-def ping_thread_loop() -> None:
+def show_countdown(remaining: int) -> None:
     """
-    Background thread that sends periodic ping messages to keep the connection alive.
-    Sends initial connection status and then pings every 30 seconds.
+    Show the startup countdown in the status label.
+    
+    Args:
+        remaining: Seconds left before connecting
     """
-    global last_connection_status, countdown_seconds, status_label
+    global countdown_seconds
     
-    # Show countdown timer from 10 to 1 seconds
-    for remaining in range(10, 0, -1):
-        if status_label:
-            try:
-                # Get root window to schedule updates on main thread
-                root = status_label.winfo_toplevel()
-                countdown_seconds = remaining
-                root.after(0, update_status)
-            except:
-                pass
-        time.sleep(1)
+    if status_label:
+        try:
+            # Get root window to schedule updates on main thread
+            root = status_label.winfo_toplevel()
+            countdown_seconds = remaining
+            root.after(0, update_status)
+        except:
+            pass
+
+
+def start_connection() -> None:
+    """
+    Connect to the API once the startup countdown has finished.
+    """
+    global last_connection_status, countdown_seconds
     
     # Reset countdown
-    countdown_seconds = 10
+    countdown_seconds = STARTUP_COUNTDOWN
     
     # Update status to "Connecting..." before attempting connection
     last_connection_status = 'connecting'
@@ -593,13 +827,9 @@ def ping_thread_loop() -> None:
     
     # Send initial connection status
     send_connection_ping(connected=True)
-    
-    # Now ping every 30 seconds
-    while not ping_event.wait(30):
-        send_connection_ping(connected=True)
 
 
-def check_for_updates_delayed() -> None:
+def check_for_updates() -> None:
     # Check for updates after startup, only runs once
     global update_check_performed
     
@@ -607,14 +837,13 @@ def check_for_updates_delayed() -> None:
         return
     
     logger.info('Starting update check...')
-    time.sleep(5)  # Give UI time to load
     
-    check_updates = config.get(CHECK_UPDATES_SETTING) if config.get(CHECK_UPDATES_SETTING) is not None else True
+    check_updates = _cget(CHECK_UPDATES_SETTING, True)
     if not check_updates:
         update_check_performed = True
         return
     
-    if update_check_event.is_set():
+    if stop_event.is_set():
         return
     
     try:
@@ -626,15 +855,15 @@ def check_for_updates_delayed() -> None:
         
         if is_newer_version(latest_version, PLUGIN_VERSION):
             logger.info(f'Update available: {PLUGIN_VERSION} -> {latest_version}')
-            if status_label:
+            # The dialog is modal, so always hand it to the Tk main loop
+            root = status_label.winfo_toplevel() if status_label else tk._default_root
+            if not root:
+                logger.warning('No window available to show the update dialog')
+            elif not stop_event.is_set():
                 try:
-                    root = status_label.winfo_toplevel()
                     root.after(0, lambda: show_update_dialog(latest_version))
                 except Exception as e:
                     logger.warning(f'Failed to schedule dialog: {e}')
-                    show_update_dialog(latest_version)
-            else:
-                show_update_dialog(latest_version)
     except Exception as e:
         logger.exception(f'Update check failed: {e}')
     finally:
@@ -657,12 +886,11 @@ def get_latest_version() -> Optional[str]:
             
             if tag_name:
                 cleaned_tag = tag_name.lstrip('v').strip()
-                if cleaned_tag and any(c.isdigit() for c in cleaned_tag) and '.' in cleaned_tag:
+                if cleaned_tag and '.' in cleaned_tag and not _DIGITS.isdisjoint(cleaned_tag):
                     version_str = cleaned_tag
             
             if not version_str and release_name:
-                import re
-                version_match = re.search(r'(?:v)?(\d+\.\d+(?:\.\d+)?)', release_name, re.IGNORECASE)
+                version_match = _VERSION_RE.search(release_name)
                 if version_match:
                     version_str = version_match.group(1)
             
@@ -677,28 +905,28 @@ def get_latest_version() -> Optional[str]:
         else:
             logger.warning(f'GitHub API error: {response.status_code}')
             return None
+    except ValueError as e:
+        # Also covers requests' JSONDecodeError
+        logger.warning(f'Invalid release data from GitHub: {e}')
+        return None
     except Exception as e:
         logger.warning(f'Failed to fetch version: {e}')
         return None
 
 
+@functools.lru_cache(maxsize=32)
 def is_newer_version(latest: str, current: str) -> bool:
     # Simple version comparison (1.0.0 format)
     try:
-        latest_parts = [int(x) for x in latest.split('.')]
-        current_parts = [int(x) for x in current.split('.')]
+        latest_parts = tuple(int(x) for x in latest.split('.'))
+        current_parts = tuple(int(x) for x in current.split('.'))
         
+        # Pad to the same length so 1.0 and 1.0.0 compare equal
         max_len = max(len(latest_parts), len(current_parts))
-        latest_parts += [0] * (max_len - len(latest_parts))
-        current_parts += [0] * (max_len - len(current_parts))
-        
-        for i in range(max_len):
-            if latest_parts[i] > current_parts[i]:
-                return True
-            elif latest_parts[i] < current_parts[i]:
-                return False
+        latest_parts += (0,) * (max_len - len(latest_parts))
+        current_parts += (0,) * (max_len - len(current_parts))
         
-        return False
+        return latest_parts > current_parts
     except Exception as e:
         logger.debug(f'Version comparison failed: {e}')
         return False
@@ -759,17 +987,19 @@ def journal_entry(cmdr: str, is_beta: bool, system: str, station: str, entry: di
     Returns:
         None or error message string
     """
-    global current_cmdr
+    global current_cmdr, _last_payload_hash
     
     try:
         # Update commander name
         if cmdr:
             current_cmdr = cmdr
         
-        # Only send on specific events to avoid spam
-        events_to_send_on = ['FSDJump', 'Location', 'Docked', 'Undocked', 'Loadout', 'Embark', 'Disembark']
+        # Nothing will be sent before startup, or while disabled or unconfigured
+        if send_buffer is None or not _cget(ENABLED_SETTING, True) or not _cget(API_KEY_SETTING, ''):
+            return None
         
-        if entry.get('event') not in events_to_send_on:
+        # Only send on specific events to avoid spam
+        if entry.get('event') not in _SEND_EVENTS:
             return None
         
         # Determine status based on state and event
@@ -784,7 +1014,7 @@ def journal_entry(cmdr: str, is_beta: bool, system: str, station: str, entry: di
             status = 'undocked'
         
         # Get configuration
-        send_ship_info = config.get(SEND_SHIP_INFO_SETTING) if config.get(SEND_SHIP_INFO_SETTING) is not None else True
+        send_ship_info = _cget(SEND_SHIP_INFO_SETTING, True)
         
         # Prepare simplified data to send (location is always sent)
         data = {
@@ -795,22 +1025,28 @@ def journal_entry(cmdr: str, is_beta: bool, system: str, station: str, entry: di
         
         # Add ship info if enabled
         if send_ship_info:
-            ship_name = 'Unknown'
-            if state.get('ShipName'):
-                ship_name = state.get('ShipName')
-            elif 'Ship' in state and isinstance(state['Ship'], dict):
-                ship_name = state['Ship'].get('name', 'Unknown')
-            elif 'ShipType' in state and state['ShipType']:
-                ship_name = state.get('ShipType')
+            ship_name = state.get('ShipName')
+            if not ship_name:
+                ship = state.get('Ship')
+                if isinstance(ship, dict):
+                    ship_name = ship.get('name', 'Unknown')
+                else:
+                    ship_name = state.get('ShipType') or 'Unknown'
             
             data['ship'] = ship_name
             data['credits'] = state.get('Credits', 0)
             data['status'] = status
         
+        # Skip the send if nothing changed since the last queued event
+        payload_hash = hash(tuple(sorted(data.items())))
+        if payload_hash == _last_payload_hash:
+            logger.debug('Skipping duplicate data for %s', entry.get('event'))
+            return None
+        
         # Queue data for sending
-        if send_queue and data:
-            send_queue.put(data)
-            logger.debug(f'Queued data for send: {entry.get("event")} - Ship info: {send_ship_info}')
+        _last_payload_hash = payload_hash
+        queue_send(data)
+        logger.debug('Queued data for send: %s - Ship info: %s', entry.get('event'), send_ship_info)
         
     except Exception as e:
         logger.exception('Error in journal_entry')
@@ -827,53 +1063,68 @@ def cmdr_data(data: dict, is_beta: bool) -> None:
         data: Commander data from CAPI
         is_beta: Whether this is a beta version
     """
-    global current_cmdr
+    global current_cmdr, _last_payload_hash
     
     try:
+        # Nothing will be sent before startup, or while disabled or unconfigured
+        if send_buffer is None or not _cget(ENABLED_SETTING, True) or not _cget(API_KEY_SETTING, ''):
+            return
+        
+        # Bind once; the rest of this function is mostly lookups in data
+        d_get = data.get
+        
+        # Without commander data there is nothing to send
+        commander = d_get('commander')
+        if not commander:
+            return
+        
         # Get configuration
-        send_ship_info = config.get(SEND_SHIP_INFO_SETTING) if config.get(SEND_SHIP_INFO_SETTING) is not None else True
+        send_ship_info = _cget(SEND_SHIP_INFO_SETTING, True)
         
         # Prepare simplified data to send
-        capi_data = {}
+        cmdr_name = commander.get('name', '')
+        capi_data = CapiSnapshot(cmdr_name)
         
-        if 'commander' in data and data['commander']:
-            commander = data['commander']
-            cmdr_name = commander.get('name', '')
-            capi_data = {'cmdr': cmdr_name}
-            
-            # Update commander name
-            if cmdr_name:
-                current_cmdr = cmdr_name
-            
-            # Add location data (always sent)
-            # Get system info if available
-            if 'lastSystem' in data and data['lastSystem']:
-                capi_data['system'] = data['lastSystem'].get('name', '')
-            
-            # Get station info if available
-            if 'lastStarport' in data and data['lastStarport']:
-                last_station = data['lastStarport']
-                capi_data['station'] = last_station.get('name', '')
+        # Update commander name
+        if cmdr_name:
+            current_cmdr = cmdr_name
+        
+        # Add location data (always sent)
+        # Get system info if available
+        last_system = d_get('lastSystem')
+        if last_system:
+            capi_data.system = last_system.get('name', '')
+        
+        # Get station info if available
+        last_station = d_get('lastStarport')
+        if last_station:
+            capi_data.station = last_station.get('name', '')
+        
+        # Add ship info if enabled
+        if send_ship_info:
+            capi_data.credits = commander.get('credits', 0)
             
-            # Add ship info if enabled
-            if send_ship_info:
-                capi_data['credits'] = commander.get('credits', 0)
-                
-                # Get ship info if available
-                if 'ships' in data and data['ships']:
-                    # Find current ship
-                    current_ship_id = data.get('currentShipId')
-                    if current_ship_id and isinstance(data['ships'], list):
-                        for ship in data['ships']:
-                            if ship.get('id') == current_ship_id:
-                                capi_data['ship'] = ship.get('name', 'Unknown')
-                                break
+            # Get ship info if available
+            ships = d_get('ships')
+            current_ship_id = d_get('currentShipId')
+            if ships and current_ship_id is not None:
+                # Find current ship; CAPI usually keys ships by id as a string
+                if isinstance(ships, dict):
+                    ship = ships.get(str(current_ship_id))
+                elif isinstance(ships, list):
+                    ship = next((s for s in ships if s.get('id') == current_ship_id), None)
+                else:
+                    ship = None
+                if ship:
+                    capi_data.ship = ship.get('name', 'Unknown')
         
-        # Queue data for sending
-        if send_queue and capi_data:
-            send_queue.put(capi_data)
-            logger.debug(f'Queued CAPI data for send - Ship info: {send_ship_info}')
+        # Queue data for sending; CAPI fields can overwrite journal ones (e.g.
+        # station), so the next journal event must not be skipped as a duplicate
+        _last_payload_hash = None
+        queue_send(capi_data)
+        logger.debug('Queued CAPI data for send - Ship info: %s', send_ship_info)
         
-    except Exception as e:
+    except (AttributeError, TypeError):
+        # CAPI data not shaped as expected, e.g. a field that isn't a dict
         logger.exception('Error in cmdr_data')
 